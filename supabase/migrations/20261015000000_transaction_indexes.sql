@@ -0,0 +1,8 @@
+-- Indexes for the filters the app sends through PostgREST.
+-- Apply with `supabase db push` or paste into the Supabase SQL editor.
+
+-- Bill Generator date range: load_party_transactions filters date with gte/lt
+create index if not exists idx_tx_date on public.transactions (date);
+
+-- Bill Generator party/site filter: load_party_transactions filters party_name and site_name with eq
+create index if not exists idx_tx_site on public.transactions (party_name, site_name);